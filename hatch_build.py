@@ -0,0 +1,24 @@
+from pathlib import Path
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+
+class CustomBuildHook(BuildHookInterface):
+    """Precompile the codegen templates into the wheel's templates.zip."""
+
+    def initialize(self, version, build_data):
+        # Editable installs render straight from the source templates.
+        if version == "editable":
+            return
+        import jinja2
+        from jinja2 import Environment, FileSystemLoader
+
+        root = Path(self.root)
+        target = root / "src/onesite/codegen/templates.zip"
+        # Same settings as codegen.render's environment: default syntax, no
+        # extensions, so the compiled modules load unchanged there.
+        env = Environment(loader=FileSystemLoader(str(root / "src/onesite/templates/codegen")))
+        env.compile_templates(str(target), zip="deflated", ignore_errors=False)
+        # render only loads the zip under this exact Jinja version, since the
+        # compiled modules depend on private jinja2.runtime names.
+        target.with_name(f"{target.name}.jinja-version").write_text(jinja2.__version__)
@@ -3,4 +3,11 @@
 # @Author: ZackFair
 # @Desc: 
 # @File: __init__.py
-# @Date: 2026/2/12 09:29
\ No newline at end of file
+# @Date: 2026/2/12 09:29
+
+import os
+
+# Worker threads for the CLI's thread pools (template copies, introspection,
+# rendering). Capped because the codegen work is mostly GIL-bound; extra
+# threads only add contention, and small containers get fewer still.
+MAX_WORKERS = min(8, os.cpu_count() or 1)
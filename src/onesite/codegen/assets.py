@@ -1,14 +1,36 @@
 import ast
-import shutil
+import os
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from rich.console import Console
 
+from .fileops import copy_file, write_if_changed
 from .render import generate_file
 
 console = Console()
 
+_TEMPLATES_ROOT = Path(__file__).resolve().parent.parent / "templates"
+_FRONTEND_TEMPLATE_ROOT = _TEMPLATES_ROOT / "frontend"
+_BACKEND_TEMPLATE_ROOT = _TEMPLATES_ROOT / "backend"
+# Frontend directories synced wholesale, relative to the frontend root.
+_SRC_DIR_UI_COMPONENTS = "src/components/ui"
+_SRC_DIR_UTILS = "src/utils"
+_SRC_DIR_LIB = "src/lib"
+# Backend template files copied verbatim, relative to the backend root.
+_BACKEND_STATIC_FILES: List[str] = [
+    "app/api/endpoints/login.py",
+    "app/core/logger.py",
+    "app/core/security.py",
+    "app/core/deps.py",
+    "app/core/tablenames.py",
+    "app/initial_data.py",
+    "app/schemas/pagination.py",
+    "app/schemas/token.py",
+    "requirements.txt",
+    "Dockerfile",
+]
+
 
 def _ensure_init_py(dir_path: Path) -> None:
     dir_path.mkdir(parents=True, exist_ok=True)
@@ -22,7 +44,7 @@ def _function_exists(file_path: Path, func_name: str) -> bool:
     if not file_path.exists():
         return False
     try:
-        tree = ast.parse(file_path.read_text())
+        tree = ast.parse(file_path.read_bytes())
         for node in ast.walk(tree):
             if isinstance(node, ast.AsyncFunctionDef) and node.name == func_name:
                 return True
@@ -33,47 +55,51 @@ def _function_exists(file_path: Path, func_name: str) -> bool:
     return False
 
 
+def _sync_template_files(
+    src_root: Path, dst_root: Path, dirs: List[str], files: List[str]
+) -> set:
+    """Copy template files from src_root to dst_root in a single walk.
+
+    *dirs* are relative directories whose direct files are all synced; *files*
+    are individual relative paths. Each source directory is scanned once with
+    os.scandir, even when it appears in both. Returns the relative paths of
+    the files found and synced.
+    """
+    wanted: Dict[str, Optional[set]] = {d: None for d in dirs}  # None = every file
+    for rel in files:
+        parent, _, name = rel.rpartition("/")
+        names = wanted.setdefault(parent, set())
+        if names is not None:
+            names.add(name)
+
+    synced = set()
+    for parent, names in wanted.items():
+        try:
+            with os.scandir(src_root / parent) as it:
+                # DirEntry caches the file type, so there's no stat per entry.
+                entries = [e for e in it if (names is None or e.name in names) and e.is_file()]
+        except FileNotFoundError:
+            continue
+        dst_dir = dst_root / parent
+        dst_dir.mkdir(parents=True, exist_ok=True)
+        for entry in entries:
+            copy_file(Path(entry.path), dst_dir / entry.name)
+            synced.add(f"{parent}/{entry.name}" if parent else entry.name)
+    return synced
+
+
 def sync_frontend_assets(cwd: Path, site_config: Dict[str, Any]):
-    template_root = Path(__file__).resolve().parent.parent / "templates" / "frontend"
+    template_root = _FRONTEND_TEMPLATE_ROOT
     target_frontend_root = cwd / "frontend"
 
-    template_components_dir = template_root / "src" / "components" / "ui"
-    target_components_dir = target_frontend_root / "src" / "components" / "ui"
-    if template_components_dir.exists():
-        target_components_dir.mkdir(parents=True, exist_ok=True)
-        for item in template_components_dir.glob("*"):
-            if item.is_file():
-                shutil.copy2(item, target_components_dir / item.name)
-        console.print(f"Synced UI components to {target_components_dir}")
-
-    template_utils_dir = template_root / "src" / "utils"
-    target_utils_dir = target_frontend_root / "src" / "utils"
-    if template_utils_dir.exists():
-        target_utils_dir.mkdir(parents=True, exist_ok=True)
-        for item in template_utils_dir.glob("*"):
-            if item.is_file():
-                shutil.copy2(item, target_utils_dir / item.name)
-        console.print(f"Synced Utils to {target_utils_dir}")
-
-    template_lib_dir = template_root / "src" / "lib"
-    target_lib_dir = target_frontend_root / "src" / "lib"
-    if template_lib_dir.exists():
-        target_lib_dir.mkdir(parents=True, exist_ok=True)
-        for item in template_lib_dir.glob("*"):
-            if item.is_file():
-                shutil.copy2(item, target_lib_dir / item.name)
-        console.print(f"Synced lib to {target_lib_dir}")
-
     config_files: List[str] = [
         "package.json",
         "tailwind.config.js",
         "postcss.config.js",
         "tsconfig.json",
         "tsconfig.node.json",
-        "vite.config.ts",
         "src/main.tsx",
         "src/App.tsx",
-        "index.html",
         "src/components/ui/button.tsx",
         "src/components/ui/input.tsx",
         "src/components/ui/label.tsx",
@@ -98,6 +124,10 @@ def sync_frontend_assets(cwd: Path, site_config: Dict[str, Any]):
         "src/services/notification-center.ts",
         "src/vite-env.d.ts",
         "src/i18n.ts",
+        # Runtime config and container startup
+        "config.js.template",
+        "entrypoint.sh",
+        "Dockerfile",
     ]
 
     # Only sync Settings.tsx if there is no singleton model generated
@@ -105,29 +135,32 @@ def sync_frontend_assets(cwd: Path, site_config: Dict[str, Any]):
     if not settings_file.exists():
         config_files.append("src/pages/Settings.tsx")
 
-    for config_file in config_files:
-        if config_file == "vite.config.ts":
-            generate_file("frontend_vite.config.ts.j2", {"config": site_config}, target_frontend_root / config_file)
-            continue
-
-        if config_file == "index.html":
-            generate_file("frontend_index.html.j2", {"config": site_config}, target_frontend_root / config_file)
-            continue
-
-        src = template_root / config_file
-        dst = target_frontend_root / config_file
-        if src.exists():
-            dst.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(src, dst)
-            console.print(f"Synced config file: {config_file}")
+    # Rendered from codegen templates rather than copied.
+    generate_file("frontend_vite.config.ts.j2", {"config": site_config}, target_frontend_root / "vite.config.ts")
+    generate_file("frontend_index.html.j2", {"config": site_config}, target_frontend_root / "index.html")
+
+    synced = _sync_template_files(
+        template_root,
+        target_frontend_root,
+        [_SRC_DIR_UI_COMPONENTS, _SRC_DIR_UTILS, _SRC_DIR_LIB],
+        config_files,
+    )
+    # The walk above already found which template directories exist; no
+    # need to stat them again.
+    synced_dirs = {rel.rpartition("/")[0] for rel in synced}
+    if _SRC_DIR_UI_COMPONENTS in synced_dirs:
+        console.print(f"Synced UI components to {target_frontend_root / _SRC_DIR_UI_COMPONENTS}")
+    if _SRC_DIR_UTILS in synced_dirs:
+        console.print(f"Synced Utils to {target_frontend_root / _SRC_DIR_UTILS}")
+    if _SRC_DIR_LIB in synced_dirs:
+        console.print(f"Synced lib to {target_frontend_root / _SRC_DIR_LIB}")
+    lines = [f"Synced config file: {f}" for f in config_files if f in synced]
+    if lines:
+        console.out("\n".join(lines), highlight=False)
 
     generate_file("frontend_nginx.conf.j2", {"config": site_config}, target_frontend_root / "nginx.template.conf")
 
-    # Sync runtime config files for container startup
-    template_config_js = template_root / "config.js.template"
-    if template_config_js.exists():
-        shutil.copy2(template_config_js, target_frontend_root / "config.js.template")
-        console.print("Synced config.js.template")
+    if "config.js.template" in synced:
         # Also generate config.js with default values for local development
         config_js_content = """// Runtime configuration - defaults for local development
 window.__ENV__ = {
@@ -138,23 +171,12 @@ window.__ENV__ = {
 };
 """
         config_js_path = target_frontend_root / "config.js"
-        config_js_path.write_text(config_js_content)
+        write_if_changed(config_js_path, config_js_content)
         console.print("Generated config.js with defaults")
 
-    template_env_sh = template_root / "entrypoint.sh"
-    if template_env_sh.exists():
-        shutil.copy2(template_env_sh, target_frontend_root / "entrypoint.sh")
-        console.print("Synced entrypoint.sh")
-
-    template_frontend_dockerfile = template_root / "Dockerfile"
-    target_frontend_dockerfile = target_frontend_root / "Dockerfile"
-    if template_frontend_dockerfile.exists():
-        shutil.copy2(template_frontend_dockerfile, target_frontend_dockerfile)
-        console.print("Synced frontend Dockerfile")
-
 
 def sync_backend_assets(cwd: Path, backend_path: Path, site_config: Dict[str, Any]):
-    template_backend_root = Path(__file__).resolve().parent.parent / "templates" / "backend"
+    template_backend_root = _BACKEND_TEMPLATE_ROOT
 
     _ensure_init_py(backend_path / "app")
     _ensure_init_py(backend_path / "app" / "api")
@@ -171,10 +193,6 @@ def sync_backend_assets(cwd: Path, backend_path: Path, site_config: Dict[str, An
     if template_endpoints_dir.exists():
         target_endpoints_dir.mkdir(parents=True, exist_ok=True)
         generate_file("backend_api_upload.py.j2", {"config": site_config}, target_endpoints_dir / "upload.py")
-        login_py = template_endpoints_dir / "login.py"
-        if login_py.exists():
-            shutil.copy2(login_py, target_endpoints_dir / "login.py")
-            console.print("Synced backend endpoint: login.py")
 
     generate_file("backend_config.py.j2", {"config": site_config}, backend_path / "app" / "core" / "config.py")
     generate_file("backend_main.py.j2", {"config": site_config}, backend_path / "app" / "main.py")
@@ -262,43 +280,7 @@ def sync_backend_assets(cwd: Path, backend_path: Path, site_config: Dict[str, An
                 else:
                     console.print(f"Skipped existing callback: {handler_name}")
 
-    for name in ["logger.py", "security.py", "deps.py", "tablenames.py"]:
-        src = template_backend_root / "app" / "core" / name
-        dst = backend_path / "app" / "core" / name
-        if src.exists():
-            dst.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(src, dst)
-            console.print(f"Synced backend {name}")
-
-    initial_data_src = template_backend_root / "app" / "initial_data.py"
-    initial_data_dst = backend_path / "app" / "initial_data.py"
-    if initial_data_src.exists():
-        initial_data_dst.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(initial_data_src, initial_data_dst)
-        console.print("Synced backend initial_data.py")
-
-    template_requirements = template_backend_root / "requirements.txt"
-    target_requirements = backend_path / "requirements.txt"
-    if template_requirements.exists():
-        shutil.copy2(template_requirements, target_requirements)
-        console.print("Synced requirements.txt")
-
-    template_backend_dockerfile = template_backend_root / "Dockerfile"
-    target_backend_dockerfile = backend_path / "Dockerfile"
-    if template_backend_dockerfile.exists():
-        shutil.copy2(template_backend_dockerfile, target_backend_dockerfile)
-        console.print("Synced backend Dockerfile")
-
-    pagination_schema_src = template_backend_root / "app" / "schemas" / "pagination.py"
-    pagination_schema_dst = backend_path / "app" / "schemas" / "pagination.py"
-    if pagination_schema_src.exists():
-        pagination_schema_dst.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(pagination_schema_src, pagination_schema_dst)
-        console.print(f"Synced pagination schema to {pagination_schema_dst}")
-
-    token_schema_src = template_backend_root / "app" / "schemas" / "token.py"
-    token_schema_dst = backend_path / "app" / "schemas" / "token.py"
-    if token_schema_src.exists():
-        token_schema_dst.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(token_schema_src, token_schema_dst)
-        console.print(f"Synced token schema to {token_schema_dst}")
+    synced = _sync_template_files(template_backend_root, backend_path, [], _BACKEND_STATIC_FILES)
+    lines = [f"Synced backend {rel}" for rel in _BACKEND_STATIC_FILES if rel in synced]
+    if lines:
+        console.out("\n".join(lines), highlight=False)
@@ -1,3 +1,4 @@
+import json
 from pathlib import Path
 from typing import Any, Dict
 
@@ -9,10 +10,8 @@ console = Console()
 def load_site_config(cwd: Path) -> Dict[str, Any]:
     config_path = cwd / "site_config.json"
     if config_path.exists():
-        import json
-
         try:
-            return json.loads(config_path.read_text())
+            return json.loads(config_path.read_bytes())
         except Exception as e:
             console.print(f"[red]Error loading site_config.json: {e}[/red]")
     return {}
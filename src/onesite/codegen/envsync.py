@@ -1,16 +1,40 @@
+import json
 from pathlib import Path
 from typing import Any, Dict
 
 from rich.console import Console
 
+from .fileops import write_if_changed
+
 console = Console()
 
 
+def _merge_env(env_content: str, new_keys: Dict[str, Any]) -> str:
+    """Update existing KEY=value lines in place and append keys not yet present.
+
+    Single pass over the file; comments and unrelated lines are kept as-is.
+    Keys whose value is None are left alone rather than written as "None".
+    """
+    pending = {key: val for key, val in new_keys.items() if val is not None}
+    updated_lines = []
+    for line in env_content.splitlines():
+        if "=" in line and not line.startswith("#"):
+            key = line.partition("=")[0].strip()
+            if key in pending:
+                updated_lines.append(f"{key}={pending.pop(key)}")
+                continue
+        updated_lines.append(line)
+
+    for key, val in pending.items():
+        updated_lines.append(f"{key}={val}")
+    return "\n".join(updated_lines) + "\n"
+
+
 def sync_env_files(config: Dict[str, Any], backend_path: Path, frontend_path: Path):
     backend_env = backend_path / ".env"
     env_content = ""
     if backend_env.exists():
-        env_content = backend_env.read_text()
+        env_content = backend_env.read_bytes().decode("utf-8")
 
     new_keys = {
         "PROJECT_NAME": config.get("project_name"),
@@ -43,31 +67,12 @@ def sync_env_files(config: Dict[str, Any], backend_path: Path, frontend_path: Pa
             if mqtt_cfg.get("client_id"):
                 new_keys["MQTT_CLIENT_ID"] = mqtt_cfg["client_id"]
 
-    import json
-
     allowed_origins = config.get("allowed_origins", [])
     if allowed_origins:
         new_keys["BACKEND_CORS_ORIGINS"] = json.dumps(allowed_origins)
 
-    lines = env_content.splitlines()
-    updated_lines = []
-    for line in lines:
-        if "=" in line and not line.startswith("#"):
-            key, _ = line.split("=", 1)
-            key = key.strip()
-            if key in new_keys:
-                updated_lines.append(f"{key}={new_keys[key]}")
-                del new_keys[key]
-            else:
-                updated_lines.append(line)
-        else:
-            updated_lines.append(line)
-
-    for key, val in new_keys.items():
-        updated_lines.append(f"{key}={val}")
-
     backend_path.mkdir(parents=True, exist_ok=True)
-    backend_env.write_text("\n".join(updated_lines))
+    write_if_changed(backend_env, _merge_env(env_content, new_keys))
     console.print("Synced backend .env")
 
     frontend_env = frontend_path / ".env"
@@ -76,7 +81,7 @@ def sync_env_files(config: Dict[str, Any], backend_path: Path, frontend_path: Pa
 
     f_env_content = ""
     if frontend_env.exists():
-        f_env_content = frontend_env.read_text()
+        f_env_content = frontend_env.read_bytes().decode("utf-8")
 
     logo = config.get("logo", "")
 
@@ -86,24 +91,7 @@ def sync_env_files(config: Dict[str, Any], backend_path: Path, frontend_path: Pa
         "VITE_PROJECT_LOGO": logo,
     }
 
-    f_lines = f_env_content.splitlines()
-    f_updated_lines = []
-    for line in f_lines:
-        if "=" in line and not line.startswith("#"):
-            key, _ = line.split("=", 1)
-            key = key.strip()
-            if key in f_new_keys:
-                f_updated_lines.append(f"{key}={f_new_keys[key]}")
-                del f_new_keys[key]
-            else:
-                f_updated_lines.append(line)
-        else:
-            f_updated_lines.append(line)
-
-    for key, val in f_new_keys.items():
-        f_updated_lines.append(f"{key}={val}")
-
     frontend_path.mkdir(parents=True, exist_ok=True)
-    frontend_env.write_text("\n".join(f_updated_lines))
+    write_if_changed(frontend_env, _merge_env(f_env_content, f_new_keys))
     console.print("Synced frontend .env")
 
@@ -0,0 +1,70 @@
+import os
+import shutil
+import stat
+from pathlib import Path
+
+
+def _is_up_to_date(src_stat: os.stat_result, dst: Path) -> bool:
+    """A previous copy_file leaves dst with the same size and mtime as src."""
+    try:
+        dst_stat = dst.stat()
+    except FileNotFoundError:
+        return False
+    return dst_stat.st_size == src_stat.st_size and dst_stat.st_mtime_ns == src_stat.st_mtime_ns
+
+
+def _copy_contents(src: Path, dst: Path) -> None:
+    if not hasattr(os, "copy_file_range"):
+        shutil.copyfile(src, dst)
+        return
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+    except OSError:
+        # Unsupported filesystem or kernel — let shutil pick its own fast path.
+        shutil.copyfile(src, dst)
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """Write content as UTF-8 unless path already holds exactly that.
+
+    Leaving identical files untouched keeps their mtime, so file watchers and
+    incremental builds downstream don't see spurious changes. Returns True if
+    the file was written.
+    """
+    data = content.encode("utf-8")
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    try:
+        path.write_bytes(data)
+    except FileNotFoundError:
+        # Parent directory missing; callers writing many files into known
+        # directories create them up front so this stays the rare path.
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+    return True
+
+
+def copy_file(src: Path, dst: Path) -> bool:
+    """Copy src to dst, keeping its permission bits and timestamps.
+
+    Skips the copy when dst is unchanged since the last sync. Returns True if
+    the file was written.
+    """
+    src_stat = src.stat()
+    if _is_up_to_date(src_stat, dst):
+        return False
+    _copy_contents(src, dst)
+    # Only mode (for scripts like entrypoint.sh) and times (for the skip check
+    # above) matter here; full copystat would also copy xattrs and flags.
+    os.chmod(dst, stat.S_IMODE(src_stat.st_mode))
+    os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+    return True
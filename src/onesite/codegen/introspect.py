@@ -1,6 +1,9 @@
+import datetime
 import inspect
+import re
+import types
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set, Tuple, Union, get_args, get_origin
+from typing import Annotated, Any, Dict, List, Optional, Set, Tuple, Union, get_args, get_origin
 
 from pydantic import BaseModel
 from pydantic_core import PydanticUndefined
@@ -10,11 +13,35 @@ from sqlmodel import SQLModel
 console = Console()
 
 def _to_snake(name: str) -> str:
-    import re
-
     return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
 
 
+_SCALAR_TYPES: Dict[Any, str] = {
+    int: "int",
+    str: "str",
+    bool: "bool",
+    float: "float",
+    datetime.datetime: "datetime",
+    datetime.date: "datetime",
+    datetime.time: "time",
+}
+
+
+def _resolve_scalar_type(annotation: Any) -> str:
+    """Map a field annotation to its scalar type name, unwrapping Optional/Annotated.
+
+    Anything not in _SCALAR_TYPES (enums, UUIDs, custom classes) is treated as "str".
+    """
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _resolve_scalar_type(get_args(annotation)[0])
+    if origin is Union or origin is types.UnionType:
+        args = [a for a in get_args(annotation) if a is not type(None)]
+        if args:
+            return _resolve_scalar_type(args[0])
+    return _SCALAR_TYPES.get(annotation, "str")
+
+
 def _is_pydantic_model(cls: Any) -> bool:
     """Check if cls is a Pydantic model suitable for JSON schema (excludes DB-backed SQLModels).
 
@@ -37,8 +64,7 @@ def _json_field_kind_from_annotation(annotation: Any) -> str:
         return "float"
     if annotation is str:
         return "str"
-    type_str = str(annotation)
-    if "datetime" in type_str:
+    if _resolve_scalar_type(annotation) in ("datetime", "time"):
         return "datetime"
     if inspect.isclass(annotation) and issubclass(annotation, Enum):
         return "enum"
@@ -82,6 +108,62 @@ def _build_json_model_schema(
     return {"name": model.__name__, "fields": fields}
 
 
+# Top-level schemas per model class; the same JSON payload model is often
+# shared by fields across many tables. Treated as read-only once built.
+_JSON_SCHEMA_CACHE: Dict[type, Dict[str, Any]] = {}
+
+
+def _json_model_schema(model: type[BaseModel]) -> Dict[str, Any]:
+    schema = _JSON_SCHEMA_CACHE.get(model)
+    if schema is None:
+        schema = _JSON_SCHEMA_CACHE[model] = _build_json_model_schema(model)
+    return schema
+
+
+# Field-name heuristics for string columns that hold upload URLs.
+_IMAGE_NAMES = frozenset({"avatar", "image", "photo", "logo"})
+_IMAGE_SUFFIXES = ("_image", "_img", "_photo")
+_FILE_NAMES = frozenset({"file", "attachment"})
+_FILE_SUFFIXES = ("_file", "_attachment")
+
+
+# Shared read-only default for missing mappings; never mutate it.
+_EMPTY: Dict[str, Any] = {}
+
+
+def _defined(value: Any) -> Any:
+    return _EMPTY if value is None or value is PydanticUndefined else value
+
+
+def _field_site_props(field: Any, sa_column_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Resolve a field's site_props; the first non-empty source wins.
+
+    Sources in order: sa_column_kwargs["info"] (plus a bare "group" key there),
+    json_schema_extra, schema_extra, then sa_column.info.
+    """
+    info = sa_column_kwargs.get("info") or _EMPTY
+    site_props = info.get("site_props") or _EMPTY
+    # Also support group directly in info (for backward compatibility)
+    if "group" in info and not site_props.get("group"):
+        return {**site_props, "group": info["group"]}
+    if site_props:
+        return site_props
+
+    for extra in (getattr(field, "json_schema_extra", None), getattr(field, "schema_extra", None)):
+        extra = _defined(extra)
+        if isinstance(extra, dict):
+            site_props = extra.get("site_props") or _EMPTY
+            if site_props:
+                return site_props
+
+    sa_column = getattr(field, "sa_column", None)
+    if sa_column is not None and sa_column is not PydanticUndefined:
+        sa_column_info = getattr(sa_column, "info", None)
+        if isinstance(sa_column_info, dict):
+            return sa_column_info.get("site_props") or _EMPTY
+    return _EMPTY
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # Three-layer permission system
 # ═══════════════════════════════════════════════════════════════════════════
@@ -326,37 +408,16 @@ def get_model_fields(
             union_key = None
 
     fields: List[Dict[str, Any]] = []
+    has_search_field = False
     for name, field in model_cls.model_fields.items():
-        sa_column_kwargs = getattr(field, "sa_column_kwargs", {})
-        if sa_column_kwargs is PydanticUndefined or sa_column_kwargs is None:
-            sa_column_kwargs = {}
-
-        info = sa_column_kwargs.get("info", {})
-        site_props = info.get("site_props", {})
-        # Also support group directly in info (for backward compatibility)
-        if "group" in info and not site_props.get("group"):
-            site_props = dict(site_props)
-            site_props["group"] = info["group"]
-        if not site_props:
-            json_schema_extra = getattr(field, "json_schema_extra", None)
-            if json_schema_extra is PydanticUndefined or json_schema_extra is None:
-                json_schema_extra = {}
-            if isinstance(json_schema_extra, dict):
-                site_props = json_schema_extra.get("site_props", {}) or {}
-
-        if not site_props:
-            schema_extra = getattr(field, "schema_extra", None)
-            if schema_extra is PydanticUndefined or schema_extra is None:
-                schema_extra = {}
-            if isinstance(schema_extra, dict):
-                site_props = schema_extra.get("site_props", {}) or {}
-
-        if not site_props:
-            sa_column = getattr(field, "sa_column", None)
-            if sa_column is not None and sa_column is not PydanticUndefined:
-                sa_column_info = getattr(sa_column, "info", {})
-                if isinstance(sa_column_info, dict):
-                    site_props = sa_column_info.get("site_props", {}) or {}
+        sa_column_kwargs = _defined(getattr(field, "sa_column_kwargs", None))
+        site_props = _field_site_props(field, sa_column_kwargs)
+        # FieldInfo attributes read more than once below; resolve them up front.
+        json_schema_extra = getattr(field, "json_schema_extra", None)
+        foreign_key = getattr(field, "foreign_key", None)
+        if foreign_key is PydanticUndefined:
+            foreign_key = None
+        default_factory = getattr(field, "default_factory", None)
 
         raw_field_permissions = site_props.get("permissions", None)  # None = inherit from model
         create_optional = site_props.get("create_optional", False)
@@ -380,7 +441,7 @@ def get_model_fields(
         )
 
         type_annotation = field.annotation
-        type_str = str(type_annotation)
+        type_str = "str"
 
         is_enum = False
         enum_values: List[Any] = []
@@ -389,7 +450,7 @@ def get_model_fields(
         json_model_schema = None
         json_item_schema = None
 
-        if inspect.isclass(type_annotation) and issubclass(type_annotation, (str, int)) and hasattr(type_annotation, "__members__"):
+        if isinstance(type_annotation, type) and issubclass(type_annotation, Enum):
             is_enum = True
             enum_values = [e.value for e in type_annotation]
             type_str = "str"
@@ -413,7 +474,7 @@ def get_model_fields(
                 if inspect.isclass(item_type) and _is_pydantic_model(item_type):
                     type_str = f"List[{item_type.__name__}]"
                     json_py_imports.append(item_type.__name__)
-                    json_item_schema = _build_json_model_schema(item_type)
+                    json_item_schema = _json_model_schema(item_type)
                 elif item_type in (dict,) or item_origin is dict:
                     value_type = item_args[1] if len(item_args) >= 2 else Any
                     if inspect.isclass(value_type) and _is_pydantic_model(value_type):
@@ -435,51 +496,26 @@ def get_model_fields(
             json_kind = "object"
             type_str = resolved_annotation.__name__
             json_py_imports.append(resolved_annotation.__name__)
-            json_model_schema = _build_json_model_schema(resolved_annotation)
-        else:
-            # Check for time type first - must check before datetime since datetime.time contains "datetime"
-            # The type_str is like "<class 'datetime.time'>" for time type
-            # We need to check for 'datetime.time' specifically to not match datetime.datetime
-            if "'datetime.time'" in type_str:
-                type_str = "time"
-            elif "int" in type_str:
-                type_str = "int"
-            elif "str" in type_str:
-                type_str = "str"
-            elif "bool" in type_str or type_annotation is bool:
-                type_str = "bool"
-            elif "float" in type_str:
-                type_str = "float"
-            elif "datetime" in type_str:
-                type_str = "datetime"
-            else:
-                type_str = "str"
+            json_model_schema = _json_model_schema(resolved_annotation)
+        elif not is_enum:
+            type_str = _resolve_scalar_type(type_annotation)
 
         ui_type = "json" if json_kind else type_str
 
-        if site_props.get("component") == "image":
+        component = site_props.get("component")
+        if component == "image":
             ui_type = "image"
-        elif site_props.get("component") == "file":
-            ui_type = "file"
-        elif ui_type == "str" and (
-            name.endswith("_image")
-            or name.endswith("_img")
-            or name.endswith("_photo")
-            or name == "avatar"
-            or name == "image"
-            or name == "photo"
-            or name == "logo"
-        ):
-            ui_type = "image"
-        elif ui_type == "str" and (
-            name.endswith("_file")
-            or name.endswith("_attachment")
-            or name == "file"
-            or name == "attachment"
-        ):
+        elif component == "file":
             ui_type = "file"
+        elif ui_type == "str":
+            if name in _IMAGE_NAMES or name.endswith(_IMAGE_SUFFIXES):
+                ui_type = "image"
+            elif name in _FILE_NAMES or name.endswith(_FILE_SUFFIXES):
+                ui_type = "file"
 
         is_search_field = site_props.get("is_search_field", False)
+        if is_search_field:
+            has_search_field = True
 
         model_key = _to_snake(model_cls.__name__)
 
@@ -490,14 +526,14 @@ def get_model_fields(
         fk_info = None
         if name.endswith("_id") and name != "id":
             is_fk = False
-            if hasattr(field, "foreign_key") and field.foreign_key is not PydanticUndefined and field.foreign_key is not None:
+            if foreign_key is not None:
                 is_fk = True
             if site_props.get("is_foreign_key"):
                 is_fk = True
             if is_fk:
                 fk_table = name[:-3]
-                if hasattr(field, "foreign_key") and field.foreign_key and isinstance(field.foreign_key, str):
-                    fk_table = field.foreign_key.split(".")[0]
+                if foreign_key and isinstance(foreign_key, str):
+                    fk_table = foreign_key.split(".")[0]
 
                 target_model_class = "".join(word.capitalize() for word in fk_table.split("_"))
                 target_service = site_props.get("target_service") or _to_snake(target_model_class)
@@ -520,14 +556,13 @@ def get_model_fields(
             type_str = f"Optional[{type_str}]"
 
         is_unique = False
-        if hasattr(field, "json_schema_extra") and field.json_schema_extra and field.json_schema_extra.get("unique"):
-            is_unique = True
-        elif sa_column_kwargs and sa_column_kwargs.get("unique"):
+        field_unique = getattr(field, "unique", None)
+        if json_schema_extra and json_schema_extra.get("unique"):
             is_unique = True
-        elif getattr(field, "json_schema_extra", None) and getattr(field, "json_schema_extra", {}).get("unique"):
+        elif sa_column_kwargs.get("unique"):
             is_unique = True
-        elif hasattr(field, "unique") and field.unique is not PydanticUndefined and field.unique is not None:
-            is_unique = field.unique
+        elif field_unique is not PydanticUndefined and field_unique is not None:
+            is_unique = field_unique
 
         # Check if local storage
         is_local_storage = site_props.get("storage") == "local" or frontend_only
@@ -556,9 +591,9 @@ def get_model_fields(
                 "default": default_value,
                 "default_factory": (
                     "list"
-                    if getattr(field, "default_factory", None) is list
+                    if default_factory is list
                     else "dict"
-                    if getattr(field, "default_factory", None) is dict
+                    if default_factory is dict
                     else None
                 ),
                 "is_enum": is_enum,
@@ -574,16 +609,16 @@ def get_model_fields(
             }
         )
 
-    has_explicit_search = any(f.get("is_search_field") for f in fields)
-    if not has_explicit_search:
+    if not has_search_field:
+        fields_by_name = {f["name"]: f for f in fields}
         guess_candidates = ["name", "title", "label", "slug", "email", "username", "full_name"]
         for candidate in guess_candidates:
-            found = next((f for f in fields if f["name"] == candidate), None)
-            if found:
-                found["is_search_field"] = True
+            if candidate in fields_by_name:
+                fields_by_name[candidate]["is_search_field"] = True
+                has_search_field = True
                 break
 
-    if not any(f.get("is_search_field") for f in fields):
+    if not has_search_field:
         first_str = next((f for f in fields if f["ui_type"] == "str" and not f["is_enum"]), None)
         if first_str:
             first_str["is_search_field"] = True
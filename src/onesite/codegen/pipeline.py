@@ -5,24 +5,28 @@ generate_code(), which serves as the public entry point.
 """
 
 import importlib
-import inspect
 import os
-import shutil
+import pkgutil
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List
 
 from pydantic_core import PydanticUndefined
 from rich.console import Console
 from sqlmodel import SQLModel
 import sqlmodel.main
 
+from .. import MAX_WORKERS
 from .assets import sync_backend_assets, sync_frontend_assets
 from .config import load_site_config
 from .envsync import sync_env_files
+from .fileops import copy_file, write_if_changed
 from .i18n import generate_locale_files
 from .introspect import get_model_fields
-from .render import generate_file
+from .render import generate_file, preload_templates, render_template
 from .router import update_api_router
 from .theme import resolve_theme
 
@@ -31,11 +35,12 @@ console = Console()
 _ROLE_ORDER = ["user", "admin", "developer"]
 _ROLE_TO_ENUM = {"user": "USER", "admin": "ADMIN", "developer": "DEVELOPER"}
 
+_TEMPLATE_MODELS_DIR = Path(__file__).resolve().parent.parent / "templates" / "models"
+
 
 # ── Helpers ────────────────────────────────────────────────────────────────
 
 def _to_snake(name: str) -> str:
-    import re
     return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
 
 
@@ -109,9 +114,7 @@ def phase_sync_models(cwd: Path, backend_path: Path) -> None:
     """Copy model .py files from *project* models/ and *template* models/ into backend."""
     models_src_dir = cwd / "models"
     models_dest_dir = backend_path / "app" / "models"
-    template_models_dir = (
-        Path(__file__).resolve().parent.parent / "templates" / "models"
-    )
+    template_models_dir = _TEMPLATE_MODELS_DIR
 
     models_dest_dir.mkdir(parents=True, exist_ok=True)
     (models_dest_dir / "__init__.py").touch(exist_ok=True)
@@ -121,14 +124,14 @@ def phase_sync_models(cwd: Path, backend_path: Path) -> None:
             f"[green]Syncing models from {models_src_dir} to {models_dest_dir}...[/green]"
         )
         for model_file in models_src_dir.glob("*.py"):
-            shutil.copy2(model_file, models_dest_dir / model_file.name)
-            console.print(f"Synced model: {model_file.name}")
+            copy_file(model_file, models_dest_dir / model_file.name)
+            console.out(f"Synced model: {model_file.name}", highlight=False)
 
     if template_models_dir.exists():
         for model_file in template_models_dir.glob("*.py"):
             target_in_project = models_src_dir / model_file.name
             if not target_in_project.exists():
-                shutil.copy2(model_file, models_dest_dir / model_file.name)
+                copy_file(model_file, models_dest_dir / model_file.name)
                 console.print(
                     f"Synced base model from template: {model_file.name}"
                 )
@@ -251,7 +254,11 @@ def phase_introspect(backend_path: Path) -> list[dict]:
     Returns a list of model metadata dicts, or an empty list on critical failure.
     """
     _install_snake_case_tablenames()
-    sys.path.insert(0, str(backend_path))
+    # app.models must stay importable under its real package name: model files
+    # import each other and the generated backend as app.models.*, so loading
+    # them from file paths under another name would register duplicate tables.
+    if str(backend_path) not in sys.path:
+        sys.path.insert(0, str(backend_path))
 
     try:
         import app.models  # noqa: F401
@@ -259,10 +266,16 @@ def phase_introspect(backend_path: Path) -> list[dict]:
         console.print(f"[red]Could not import app.models: {e}[/red]")
         return []
 
-    models_dir = backend_path / "app" / "models"
-    module_names = [f.stem for f in models_dir.glob("*.py") if f.stem != "__init__" and not f.stem.startswith("_")]
-    found_models: list[dict] = []
+    module_names = [
+        name for _, name, _ in pkgutil.iter_modules(app.models.__path__)
+        if not name.startswith("_")
+    ]
+    model_modules = {f"app.models.{name}" for name in module_names}
+    seen: set[int] = set()
+    candidates: list[tuple[type, str, str, str]] = []
 
+    # Imports stay sequential (they serialize on the import lock anyway), and
+    # so does candidate selection, which depends on the shared *seen* set.
     for module_name in module_names:
         full_module_name = f"app.models.{module_name}"
         try:
@@ -277,20 +290,43 @@ def phase_introspect(backend_path: Path) -> list[dict]:
             console.print(f"[red]Error importing {full_module_name}: {e}[/red]")
             continue
 
-        module_models = _introspect_module(module, module_name, full_module_name)
-        if module_models is None:  # fatal error (e.g. missing import_key)
-            return []
-        found_models.extend(module_models)
+        candidates.extend(
+            _module_model_classes(module, module_name, full_module_name, model_modules, seen)
+        )
 
+    # Field introspection of each class is independent; overlap it across
+    # threads. map() keeps results in discovery order.
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        found_models = list(
+            executor.map(lambda c: _process_introspected_class(*c), candidates)
+        )
+    if any(mdl is None for mdl in found_models):  # fatal error (e.g. missing import_key)
+        return []
     return found_models
 
 
-def _introspect_module(module: Any, module_name: str, full_module_name: str) -> list[dict] | None:
-    """Introspect a single model module and return model metadata dicts."""
-    results: list[dict] = []
+def _module_model_classes(
+    module: Any,
+    module_name: str,
+    full_module_name: str,
+    model_modules: set[str],
+    seen: set[int],
+) -> list[tuple[type, str, str, str]]:
+    """Select the SQLModel classes a single model module contributes.
+
+    Returns ``(cls, name, module_name, full_module_name)`` tuples for
+    _process_introspected_class. Classes re-exported from another model module
+    are left to the module that defines them, and *seen* ensures each class is
+    picked only once.
+    """
+    results: list[tuple[type, str, str, str]] = []
 
-    for name, obj in inspect.getmembers(module):
-        if not (inspect.isclass(obj) and issubclass(obj, SQLModel) and obj is not SQLModel):
+    for name, obj in sorted(vars(module).items()):
+        if not (isinstance(obj, type) and issubclass(obj, SQLModel) and obj is not SQLModel):
+            continue
+        if id(obj) in seen:
+            continue
+        if obj.__module__ != full_module_name and obj.__module__ in model_modules:
             continue
 
         table_args = getattr(obj, "__table_args__", None)
@@ -314,10 +350,8 @@ def _introspect_module(module: Any, module_name: str, full_module_name: str) ->
         if not (hasattr(obj, "metadata") and (getattr(obj, "__table__", None) is not None or singleton_marker or onesite_marker or builtin_marker)):
             continue
 
-        mdl = _process_introspected_class(obj, name, module_name, full_module_name)
-        if mdl is None:
-            return None  # fatal — caller should stop
-        results.append(mdl)
+        seen.add(id(obj))
+        results.append((obj, name, module_name, full_module_name))
 
     return results
 
@@ -452,6 +486,18 @@ def _resolve_fk_labels_and_reverse(models: list[dict], model_map: dict) -> None:
     # target_model from the FK table name, which often matches the filename
     source_mod_map: dict[str, dict] = {m["source_module"]: m for m in models if m.get("source_module")}
 
+    # Readable-field lists depend only on the model, so build them once
+    # instead of per FK pointing at (or out of) it.
+    readable_fields: dict[str, list[dict]] = {}
+    readable_scalar_fields: dict[str, list[dict]] = {}
+    for model in models:
+        readable = [
+            f for f in model["fields"]
+            if "r" in f["permissions"] and f["name"] != "password"
+        ]
+        readable_fields[model["name"]] = readable
+        readable_scalar_fields[model["name"]] = [f for f in readable if not f.get("fk_info")]
+
     for model in models:
         for fk in model["foreign_keys"]:
             target_model = model_map.get(fk["target_model"])
@@ -476,12 +522,7 @@ def _resolve_fk_labels_and_reverse(models: list[dict], model_map: dict) -> None:
             fk["label_field"] = (
                 target_model.get("unique_search_field") or target_model["search_field"]
             )
-            fk["target_readable_fields"] = [
-                f for f in target_model["fields"]
-                if "r" in f["permissions"]
-                and f["name"] != "password"
-                and not f.get("fk_info")
-            ]
+            fk["target_readable_fields"] = readable_scalar_fields[target_model["name"]]
 
             # Skip self-referencing FKs and link/timeseries/latest tables
             if model.get("is_link_table") or model.get("is_timescaledb") or model.get("is_latest_table") or model["name"] == target_model["name"]:
@@ -489,12 +530,6 @@ def _resolve_fk_labels_and_reverse(models: list[dict], model_map: dict) -> None:
 
             reverse_name = _pluralize(model["module_name"])
 
-            source_readable_fields = [
-                f for f in model["fields"]
-                if "r" in f["permissions"]
-                and f["name"] != "password"
-            ]
-
             target_model["reverse_foreign_keys"].append({
                 "name": reverse_name,
                 "source_model": model["name"],
@@ -502,16 +537,15 @@ def _resolve_fk_labels_and_reverse(models: list[dict], model_map: dict) -> None:
                 "source_fk_field": fk["name"],
                 "label_field": model.get("unique_search_field") or model["search_field"],
                 "display": fk.get("reverse_display", True),
-                "source_readable_fields": source_readable_fields,
+                "source_readable_fields": readable_fields[model["name"]],
             })
 
 
-def _resolve_m2m(models: list[dict], model_map: dict, module_map: dict) -> None:
+def _resolve_m2m(
+    link_tables: list[dict], models: list[dict], model_map: dict, module_map: dict
+) -> None:
     """Resolve many-to-many relationships through link tables."""
-    for model in models:
-        if not model.get("is_link_table"):
-            continue
-
+    for model in link_tables:
         fks = model["foreign_keys"]
         if len(fks) < 2:
             continue
@@ -837,7 +871,6 @@ def _scan_model_table_configs(models_dir: Path) -> tuple[list[dict], list[dict]]
       configs: for model table generation + FK extensions (files with timescaledb_model_table)
       ts_imports: for importing timeseries models at runtime (all files with is_timescaledb)
     """
-    import re
     configs: list[dict] = []
     ts_imports: list[dict] = []
     for f in sorted(models_dir.glob("*.py")):
@@ -936,8 +969,8 @@ def phase_generate_model_tables(cwd: Path, backend_path: Path) -> None:
         class_name = _to_pascal(cfg["model_table"])
         table_name = cfg["model_table"]
         filepath = models_src_dir / f"{table_name}.py"
-        filepath.write_text(
-            _MODEL_TABLE_TPL.format(class_name=class_name, table_name=table_name)
+        write_if_changed(
+            filepath, _MODEL_TABLE_TPL.format(class_name=class_name, table_name=table_name)
         )
         console.print(f"[green]Generated model table: {table_name}.py[/green]")
 
@@ -955,7 +988,7 @@ def phase_generate_model_tables(cwd: Path, backend_path: Path) -> None:
         latest_file = models_src_dir / f"{ts_file}_latest.py"
         tc = entry.get("time_column", "reported_at")
         latest_content = _generate_latest_model(ts_cls, latest_cls, ts_file, ef, es, mf, time_column=tc)
-        latest_file.write_text(latest_content)
+        write_if_changed(latest_file, latest_content)
         console.print(f"[green]Generated latest table: {latest_file.name}[/green]")
 
     # ── Generate FK extension + ts model imports into backend/app/models/ ──
@@ -1003,7 +1036,7 @@ def phase_generate_model_tables(cwd: Path, backend_path: Path) -> None:
         return
 
     ext_file = backend_models_dir / "_model_extensions.py"
-    ext_file.write_text("\n".join(lines))
+    write_if_changed(ext_file, "\n".join(lines))
     console.print(f"[green]Generated model extensions: _model_extensions.py[/green]")
 
     # Append import to __init__.py
@@ -1086,6 +1119,7 @@ def phase_resolve_relationships(models: list[dict]) -> list[dict]:
     """
     model_map = {m["name"]: m for m in models}
     module_map = {m["module_name"]: m for m in models}
+    link_tables = [m for m in models if m.get("is_link_table")]
 
     _resolve_min_roles(models)
     _init_link_table_flags(models)
@@ -1093,7 +1127,7 @@ def phase_resolve_relationships(models: list[dict]) -> list[dict]:
     _resolve_timeseries_relations(models)
     _inject_model_table_fks(models)
     _resolve_fk_labels_and_reverse(models, model_map)
-    _resolve_m2m(models, model_map, module_map)
+    _resolve_m2m(link_tables, models, model_map, module_map)
 
     return models
 
@@ -1122,106 +1156,127 @@ def phase_theme_and_assets(site_config: dict, cwd: Path, backend_path: Path) ->
 # Phase 6 — Per-Model Code Generation
 # ═══════════════════════════════════════════════════════════════════════════
 
-def _generate_singleton(model: dict, cwd: Path, backend_path: Path) -> None:
-    """Generate code for singleton / config models."""
-    context = {"model": model}
+def _output_dirs(cwd: Path, backend_path: Path) -> dict[str, Path]:
+    """Resolve the directories per-model outputs land in, once per run."""
+    frontend_src = cwd / "frontend" / "src"
+    return {
+        "schemas": backend_path / "app" / "schemas",
+        "cruds": backend_path / "app" / "cruds",
+        "services": backend_path / "app" / "services",
+        "endpoints": backend_path / "app" / "api" / "endpoints",
+        "tests": backend_path / "tests",
+        "frontend_services": frontend_src / "services",
+        "frontend_stores": frontend_src / "stores",
+        "frontend_pages": frontend_src / "pages",
+    }
+
+
+# Backend template → output directory (key of _output_dirs) for "<module_name>.py".
+_BACKEND_OUTPUT_DIRS: dict[str, str] = {
+    "singleton_schema.py.j2": "schemas",
+    "singleton_crud.py.j2": "cruds",
+    "singleton_service.py.j2": "services",
+    "singleton_api.py.j2": "endpoints",
+    "schema.py.j2": "schemas",
+    "user_schema.py.j2": "schemas",
+    "crud.py.j2": "cruds",
+    "user_crud.py.j2": "cruds",
+    "service.py.j2": "services",
+    "user_service.py.j2": "services",
+    "api.py.j2": "endpoints",
+}
+
+# Models whose backend layers use a dedicated template instead of the generic one.
+_MODEL_TEMPLATE_OVERRIDES: dict[tuple[str, str], str] = {
+    ("User", "schema.py.j2"): "user_schema.py.j2",
+    ("User", "crud.py.j2"): "user_crud.py.j2",
+    ("User", "service.py.j2"): "user_service.py.j2",
+}
+
+
+def _singleton_targets(model: dict, dirs: dict[str, Path]) -> list[tuple[str, Path]]:
+    """List (template, output path) pairs for singleton / config models."""
+    targets: list[tuple[str, Path]] = []
+    module_name = model["module_name"]
     is_config = (
-        model["module_name"] == "system_config" and model["name"] == "SystemConfig"
+        module_name == "system_config" and model["name"] == "SystemConfig"
     ) or (
-        model["module_name"] == "custom_config" and model["name"] == "CustomConfig"
+        module_name == "custom_config" and model["name"] == "CustomConfig"
     )
 
     if not model.get("frontend_only"):
         for tpl in ("singleton_schema.py.j2", "singleton_crud.py.j2",
                      "singleton_service.py.j2", "singleton_api.py.j2"):
-            generate_file(tpl, context, _backend_path(tpl, model, backend_path))
-        generate_file(
-            "singleton_frontend_service.ts.j2", context,
-            cwd / "frontend" / "src" / "services" / f"{model['module_name']}.ts",
-        )
+            targets.append((tpl, dirs[_BACKEND_OUTPUT_DIRS[tpl]] / f"{module_name}.py"))
+        targets.append((
+            "singleton_frontend_service.ts.j2",
+            dirs["frontend_services"] / f"{module_name}.ts",
+        ))
 
-    generate_file(
-        "singleton_store.ts.j2", context,
-        cwd / "frontend" / "src" / "stores" / f"use{model['name']}Store.ts",
-    )
+    targets.append((
+        "singleton_store.ts.j2",
+        dirs["frontend_stores"] / f"use{model['name']}Store.ts",
+    ))
 
     if not is_config:
-        generate_file(
-            "singleton_page.tsx.j2", context,
-            cwd / "frontend" / "src" / "pages" / f"{model['module_name']}" / "index.tsx",
-        )
-
-
-def _backend_path(tpl: str, model: dict, backend_path: Path) -> Path:
-    """Map a backend template name to its output path."""
-    mapping = {
-        "singleton_schema.py.j2": backend_path / "app" / "schemas" / f"{model['module_name']}.py",
-        "singleton_crud.py.j2": backend_path / "app" / "cruds" / f"{model['module_name']}.py",
-        "singleton_service.py.j2": backend_path / "app" / "services" / f"{model['module_name']}.py",
-        "singleton_api.py.j2": backend_path / "app" / "api" / "endpoints" / f"{model['module_name']}.py",
-        "schema.py.j2": backend_path / "app" / "schemas" / f"{model['module_name']}.py",
-        "user_schema.py.j2": backend_path / "app" / "schemas" / f"{model['module_name']}.py",
-        "crud.py.j2": backend_path / "app" / "cruds" / f"{model['module_name']}.py",
-        "user_crud.py.j2": backend_path / "app" / "cruds" / f"{model['module_name']}.py",
-        "service.py.j2": backend_path / "app" / "services" / f"{model['module_name']}.py",
-        "user_service.py.j2": backend_path / "app" / "services" / f"{model['module_name']}.py",
-        "api.py.j2": backend_path / "app" / "api" / "endpoints" / f"{model['module_name']}.py",
-        "backend_test.py.j2": backend_path / "tests" / f"test_{model['module_name']}_api.py",
-    }
-    return mapping[tpl]
-
+        targets.append((
+            "singleton_page.tsx.j2",
+            dirs["frontend_pages"] / module_name / "index.tsx",
+        ))
+    return targets
 
-def _generate_regular_model(model: dict, cwd: Path, backend_path: Path) -> None:
-    """Generate code for a regular (non-singleton, non-link) model."""
-    context = {"model": model}
-    is_user_model = model["name"] == "User"
-
-    tpl_schema = "user_schema.py.j2" if is_user_model else "schema.py.j2"
-    tpl_crud = "user_crud.py.j2" if is_user_model else "crud.py.j2"
-    tpl_service = "user_service.py.j2" if is_user_model else "service.py.j2"
 
+def _regular_model_targets(model: dict, dirs: dict[str, Path]) -> list[tuple[str, Path]]:
+    """List (template, output path) pairs for a regular (non-singleton, non-link) model."""
     # Latest tables are internal companions — no direct CRUD, API, or frontend
     if model.get("is_latest_table"):
-        return
-
-    generate_file(tpl_schema, context, _backend_path(tpl_schema, model, backend_path))
-    generate_file(tpl_crud, context, _backend_path(tpl_crud, model, backend_path))
-    generate_file(tpl_service, context, _backend_path(tpl_service, model, backend_path))
-    generate_file("api.py.j2", context, _backend_path("api.py.j2", model, backend_path))
+        return []
 
-    generate_file(
-        "frontend_service.ts.j2", context,
-        cwd / "frontend" / "src" / "services" / f"{model['module_name']}.ts",
-    )
+    module_name = model["module_name"]
+    targets: list[tuple[str, Path]] = []
+    for base in ("schema.py.j2", "crud.py.j2", "service.py.j2", "api.py.j2"):
+        tpl = _MODEL_TEMPLATE_OVERRIDES.get((model["name"], base), base)
+        targets.append((tpl, dirs[_BACKEND_OUTPUT_DIRS[tpl]] / f"{module_name}.py"))
+    targets.append(("frontend_service.ts.j2", dirs["frontend_services"] / f"{module_name}.ts"))
 
     # Timeseries models: no standalone pages/store — data is shown on parent entity detail
-    if model.get("is_timescaledb") or model.get("is_latest_table"):
-        return
-
-    generate_file(
-        "frontend_store.ts.j2", context,
-        cwd / "frontend" / "src" / "stores" / f"use{model['name']}Store.ts",
-    )
-    generate_file(
-        "frontend_page_list.tsx.j2", context,
-        cwd / "frontend" / "src" / "pages" / f"{model['module_name']}" / "index.tsx",
-    )
-    generate_file(
-        "frontend_page_detail.tsx.j2", context,
-        cwd / "frontend" / "src" / "pages" / f"{model['module_name']}" / "detail.tsx",
-    )
+    if model.get("is_timescaledb"):
+        return targets
+
+    pages_dir = dirs["frontend_pages"] / module_name
+    targets += [
+        ("frontend_store.ts.j2", dirs["frontend_stores"] / f"use{model['name']}Store.ts"),
+        ("frontend_page_list.tsx.j2", pages_dir / "index.tsx"),
+        ("frontend_page_detail.tsx.j2", pages_dir / "detail.tsx"),
+    ]
 
     if model.get("page_edit"):
-        generate_file(
-            "frontend_page_create.tsx.j2", context,
-            cwd / "frontend" / "src" / "pages" / f"{model['module_name']}" / "create.tsx",
-        )
+        targets.append(("frontend_page_create.tsx.j2", pages_dir / "create.tsx"))
 
     if not model.get("frontend_only"):
-        generate_file(
-            "backend_test.py.j2", context,
-            _backend_path("backend_test.py.j2", model, backend_path),
-        )
+        targets.append(("backend_test.py.j2", dirs["tests"] / f"test_{module_name}_api.py"))
+    return targets
+
+
+def _model_targets(model: dict, dirs: dict[str, Path]) -> list[tuple[str, Path]]:
+    """List (template, output path) pairs for any generated model."""
+    if model.get("is_singleton") or (
+        model["module_name"] == "system_config" and model["name"] == "SystemConfig"
+    ) or (
+        model["module_name"] == "custom_config" and model["name"] == "CustomConfig"
+    ):
+        return _singleton_targets(model, dirs)
+    return _regular_model_targets(model, dirs)
+
+
+def _generate_model(model: dict, targets: list[tuple[str, Path]]) -> list[Path]:
+    """Render every file for a single model, then write them out in one pass.
+
+    Returns the paths that were actually written; the caller reports them.
+    """
+    context = {"model": model}
+    rendered = [(path, render_template(tpl, context)) for tpl, path in targets]
+    return [path for path, content in rendered if write_if_changed(path, content)]
 
 
 def _sort_api_models(api_models: list[dict], site_config: dict) -> list[dict]:
@@ -1244,24 +1299,38 @@ def phase_generate_per_model(
 
     Returns the sorted list of API-visible models for use in routing & navigation.
     """
-    for model in models:
-        if model["is_link_table"] and not model.get("is_association_table"):
-            continue
+    # Plain link tables only back M2M fields on other models; association
+    # tables (link tables with extra columns) get full CRUD like any model.
+    generated = [
+        m for m in models
+        if not m["is_link_table"] or m.get("is_association_table")
+    ]
 
-        if model.get("is_singleton") or (
-            model["module_name"] == "system_config" and model["name"] == "SystemConfig"
-        ) or (
-            model["module_name"] == "custom_config" and model["name"] == "CustomConfig"
-        ):
-            _generate_singleton(model, cwd, backend_path)
-        else:
-            _generate_regular_model(model, cwd, backend_path)
+    dirs = _output_dirs(cwd, backend_path)
+    targets = [_model_targets(m, dirs) for m in generated]
+
+    # The outputs share a handful of directories (app/schemas, app/cruds, one
+    # pages/<model> dir each, ...), so create each once rather than per file.
+    for out_dir in {path.parent for model_targets in targets for _, path in model_targets}:
+        out_dir.mkdir(parents=True, exist_ok=True)
+
+    preload_templates()
+
+    # Models write to disjoint files, so they can be rendered concurrently.
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        written = list(executor.map(_generate_model, generated, targets))
+
+    # One write for the whole batch, in model order rather than interleaved
+    # by whichever worker finishes first.
+    lines = [f"Generated {path}" for paths in written for path in paths]
+    if lines:
+        console.out("\n".join(lines), highlight=False)
 
     api_models = [
-        m for m in models
+        m for m in generated
         if not m.get("frontend_only")
         and not m.get("is_latest_table")
-        and (not m["is_link_table"] or (m.get("is_association_table") and m.get("show_in_menu")))
+        and (not m["is_link_table"] or m.get("show_in_menu"))
     ]
     return _sort_api_models(api_models, site_config)
 
@@ -1270,6 +1339,12 @@ def phase_generate_per_model(
 # Phase 7 — Aggregated Generation
 # ═══════════════════════════════════════════════════════════════════════════
 
+def _render_file(template_name: str, context: dict, output_path: Path) -> list[Path]:
+    """Render one aggregated output; returns ``[output_path]`` if it was rewritten."""
+    content = render_template(template_name, context)
+    return [output_path] if write_if_changed(output_path, content) else []
+
+
 def _validate_notification_model(models: list[dict]) -> tuple[bool, str]:
     """Check notification model requirements; return (enabled, api_base)."""
     notification_model = next(
@@ -1303,27 +1378,34 @@ def phase_generate_aggregated(
     backend_path: Path,
 ) -> None:
     """Generate cross-cutting files: router, routes, menu, dashboard, i18n, etc."""
+    # Every output below is an independent file, so collect the jobs and
+    # render/write them concurrently. Each job returns the paths it rewrote.
+    jobs: list[Callable[[], list[Path]]] = []
+
     # ── TimescaleDB: collect models and generate db.py ──
     timescaledb_models = [m for m in models if m.get("is_timescaledb")]
     has_timescaledb = bool(timescaledb_models)
-    generate_file(
+    jobs.append(partial(
+        _render_file,
         "db.py.j2",
         {
             "has_timescaledb": has_timescaledb,
             "timescaledb_models": timescaledb_models,
         },
         backend_path / "app" / "core" / "db.py",
-    )
+    ))
 
     # ── Notification model lookup & WS (order preserved from original) ──
     notifications_enabled, notifications_api_base = _validate_notification_model(models)
 
-    generate_file("ws.py.j2", {}, backend_path / "app" / "core" / "ws.py")
-    generate_file("ws_api.py.j2", {}, backend_path / "app" / "api" / "endpoints" / "ws.py")
+    jobs.append(partial(_render_file, "ws.py.j2", {}, backend_path / "app" / "core" / "ws.py"))
+    jobs.append(partial(_render_file, "ws_api.py.j2", {}, backend_path / "app" / "api" / "endpoints" / "ws.py"))
 
     # ── API router ──
     scheduled_tasks = site_config.get("scheduled_tasks", [])
-    update_api_router(api_models, backend_path / "app" / "api" / "api.py", scheduled_tasks)
+    jobs.append(partial(
+        update_api_router, api_models, backend_path / "app" / "api" / "api.py", scheduled_tasks
+    ))
 
     # ── Settings page ──
     system_model = next(
@@ -1336,63 +1418,80 @@ def phase_generate_aggregated(
          if m["module_name"] == "custom_config" and m["name"] == "CustomConfig"),
         None,
     )
-    generate_file(
+    jobs.append(partial(
+        _render_file,
         "settings_page.tsx.j2",
         {"system_model": system_model, "custom_model": custom_model},
         cwd / "frontend" / "src" / "pages" / "Settings.tsx",
-    )
+    ))
 
     # ── Profile page ──
     user_model = next((m for m in models if m["name"] == "User"), None)
     if user_model is not None:
-        generate_file(
+        jobs.append(partial(
+            _render_file,
             "profile.tsx.j2",
             {"model": user_model},
             cwd / "frontend" / "src" / "pages" / "Profile.tsx",
-        )
+        ))
 
     # ── Routes, Menu, Dashboard ──
     frontend_models = [
         m for m in api_models
         if not m.get("is_timescaledb") and not m.get("is_latest_table")
     ]
-    generate_file(
+    jobs.append(partial(
+        _render_file,
         "frontend_routes.tsx.j2", {"models": frontend_models},
         cwd / "frontend" / "src" / "Routes.tsx",
-    )
-    generate_file(
+    ))
+    jobs.append(partial(
+        _render_file,
         "frontend_menu.tsx.j2", {"models": frontend_models},
         cwd / "frontend" / "src" / "Menu.tsx",
-    )
-    generate_file(
+    ))
+    jobs.append(partial(
+        _render_file,
         "dashboard_page.tsx.j2",
         {"models": frontend_models, "scheduled_tasks": scheduled_tasks},
         cwd / "frontend" / "src" / "pages" / "Dashboard.tsx",
-    )
+    ))
 
     # ── Feature flags ──
-    generate_file(
+    jobs.append(partial(
+        _render_file,
         "frontend_features.ts.j2",
         {
             "notifications_enabled": notifications_enabled,
             "notifications_api_base": notifications_api_base,
         },
         cwd / "frontend" / "src" / "features.ts",
-    )
+    ))
 
     # ── Scheduled task service/store ──
     if scheduled_tasks:
-        generate_file(
+        jobs.append(partial(
+            _render_file,
             "frontend_task_service.ts.j2", {},
             cwd / "frontend" / "src" / "services" / "tasks.ts",
-        )
-        generate_file(
+        ))
+        jobs.append(partial(
+            _render_file,
             "task_store.ts.j2", {},
             cwd / "frontend" / "src" / "stores" / "useTaskStore.ts",
-        )
+        ))
 
     # ── Locale files ──
-    generate_locale_files(models, cwd / "frontend" / "src" / "locales")
+    jobs.append(partial(generate_locale_files, models, cwd / "frontend" / "src" / "locales"))
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = [executor.submit(job) for job in jobs]
+        written = [future.result() for future in futures]  # re-raises the first failure
+
+    # Reported after the pool drains, in job order, as in phase_generate_per_model.
+    lines = [f"Generated {path}" for paths in written for path in paths]
+    if lines:
+        console.out("\n".join(lines), highlight=False)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
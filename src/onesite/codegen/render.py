@@ -1,18 +1,104 @@
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 
-from jinja2 import Environment, FileSystemLoader
+import jinja2
+from jinja2 import (
+    BaseLoader,
+    BytecodeCache,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    ModuleLoader,
+)
 from rich.console import Console
 
+from .fileops import write_if_changed
+
 console = Console()
 
-TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "templates" / "codegen"
+_PACKAGE_DIR = Path(__file__).resolve().parent.parent
+TEMPLATE_DIR = _PACKAGE_DIR / "templates" / "codegen"
+# Precompiled form of TEMPLATE_DIR, built into wheels by hatch_build.py (or by
+# compile_templates() / `site compile-templates` by hand).
+COMPILED_TEMPLATES = Path(__file__).resolve().parent / "templates.zip"
+# Jinja version that compiled the zip. The compiled modules import private
+# jinja2.runtime names, so they are only safe to load under that same version.
+COMPILED_TEMPLATES_VERSION = COMPILED_TEMPLATES.with_name("templates.zip.jinja-version")
+
+
+def _use_compiled_templates() -> bool:
+    try:
+        zip_mtime = COMPILED_TEMPLATES.stat().st_mtime_ns
+        built_with = COMPILED_TEMPLATES_VERSION.read_text().strip()
+    except FileNotFoundError:
+        return False
+    if built_with != jinja2.__version__:
+        return False
+    # Installed wheels never change their templates, and install order says
+    # nothing about mtimes, so trust the zip there. In a source checkout the
+    # .j2 files may have been edited since the zip was built; fall back to
+    # them unless the zip is newer than every one.
+    if not (_PACKAGE_DIR.parent.parent / "pyproject.toml").exists():
+        return True
+    return all(p.stat().st_mtime_ns <= zip_mtime for p in TEMPLATE_DIR.glob("*.j2"))
+
+
+# Decided once at import, so a run never mixes the two template sources.
+_COMPILED = _use_compiled_templates()
+
+
+def _template_loader() -> BaseLoader:
+    if _COMPILED:
+        return ModuleLoader(str(COMPILED_TEMPLATES))
+    return FileSystemLoader(str(TEMPLATE_DIR))
+
+
+def _bytecode_cache() -> Optional[BytecodeCache]:
+    # Precompiled templates are already bytecode; source templates get a
+    # per-user on-disk cache so later runs skip the Jinja compiler.
+    if _COMPILED:
+        return None
+    return FileSystemBytecodeCache()
+
+
+# Shared across calls so each template is parsed and compiled only once per run.
+_JINJA_ENV = Environment(
+    loader=_template_loader(),
+    bytecode_cache=_bytecode_cache(),
+    auto_reload=False,
+    cache_size=-1,
+)
+
+
+def compile_templates(target: Path = COMPILED_TEMPLATES) -> None:
+    """Precompile every codegen template into a zip loadable by ModuleLoader."""
+    env = _JINJA_ENV.overlay(loader=FileSystemLoader(str(TEMPLATE_DIR)))
+    env.compile_templates(str(target), zip="deflated", ignore_errors=False)
+    target.with_name(f"{target.name}.jinja-version").write_text(jinja2.__version__)
+
+
+def preload_templates() -> None:
+    """Compile every codegen template into the shared environment's cache.
+
+    With auto_reload off, later get_template calls are then plain cache hits,
+    and worker threads never race to compile the same template.
+    """
+    for path in TEMPLATE_DIR.glob("*.j2"):
+        _JINJA_ENV.get_template(path.name)
+
+
+def render_template(template_name: str, context: Dict) -> str:
+    return _JINJA_ENV.get_template(template_name).render(context)
+
+
+def write_file(output_path: Path, content: str):
+    # Jinja already emits "\n" line endings, so write_if_changed stores raw
+    # UTF-8 bytes rather than going through a locale-dependent text wrapper.
+    if write_if_changed(output_path, content):
+        # Plain per-file status line: console.out skips Rich markup parsing, so
+        # a path containing "[...]" is printed verbatim.
+        console.out(f"Generated {output_path}", highlight=False)
 
 
 def generate_file(template_name: str, context: Dict, output_path: Path):
-    env = Environment(loader=FileSystemLoader(str(TEMPLATE_DIR)))
-    template = env.get_template(template_name)
-    content = template.render(context)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(content)
-    console.print(f"Generated {output_path}")
+    write_file(output_path, render_template(template_name, context))
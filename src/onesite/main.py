@@ -1,20 +1,16 @@
 import typer
+import asyncio
 import shutil
 import os
 import sys
+import json
+import subprocess
+import concurrent.futures
 from typing import Optional
 from pathlib import Path
 from rich.console import Console
-from jinja2 import Environment, FileSystemLoader
 
-# Add current path to sys.path so we can import modules from the generated project
-try:
-    sys.path.append(os.getcwd())
-except FileNotFoundError:
-    # Handle the case where the current working directory has been deleted
-    # We can't print to console easily here as it might not be init, but we can safely ignore
-    # The command execution will likely fail later with a better error or we can check in commands
-    pass
+from onesite import MAX_WORKERS
 
 app = typer.Typer(
     help="OneSiteTool - Generate Web Projects from SQLModel",
@@ -33,12 +29,6 @@ def get_cwd_safely() -> Path:
 
 TEMPLATE_DIR = Path(__file__).parent / "templates"
 
-def render_template(template_path: Path, context: dict, output_path: Path):
-    env = Environment(loader=FileSystemLoader(str(template_path.parent)))
-    template = env.get_template(template_path.name)
-    content = template.render(context)
-    output_path.write_text(content)
-
 @app.command()
 def init():
     """
@@ -59,13 +49,12 @@ def init():
     else:
         console.print("[yellow]No existing project files found, will initialize from scratch[/yellow]")
 
-    template_models_dir = Path(__file__).parent / "templates" / "models"
+    template_models_dir = TEMPLATE_DIR / "models"
     models_dir = base_dir / "models"
     site_config_file = base_dir / "site_config.json"
 
     # Create site_config.json if not exists
     if not has_site_config:
-        import json
         project_name = base_dir.name.lower().replace("-", "_")
         site_config = {
             "project_name": project_name,
@@ -107,6 +96,44 @@ def init():
     console.print("[green]Run 'site sync' to generate API code.[/green]")
 
 
+def _parallel_copytree(src: Path, dst: Path, ignore=None):
+    # copytree still walks the tree and creates directories in order; only the
+    # per-file copies, which mostly wait on the disk, are handed to the pool.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = []
+
+        def submit_copy(src_file, dst_file):
+            futures.append(executor.submit(shutil.copy2, src_file, dst_file))
+            return dst_file
+
+        shutil.copytree(src, dst, ignore=ignore, copy_function=submit_copy)
+        for future in concurrent.futures.as_completed(futures):
+            future.result()
+
+    # copytree copies each directory's stats before the pooled files land in
+    # it, so the late writes bump the mtimes; reapply them now that all are in.
+    for dirpath, _, _ in os.walk(dst):
+        shutil.copystat(src / Path(dirpath).relative_to(dst), dirpath)
+
+# Copied template files that carry "{{ name }}" placeholders for create to fill.
+_PLACEHOLDER_FILES = ("backend/app/core/config.py", "frontend/index.html")
+
+def _fill_placeholders(root: Path, values: dict):
+    # The placeholders are ASCII, so replace on raw bytes: no decode/encode
+    # round-trip, and each file is read once and written only if it changed.
+    replacements = [(f"{{{{ {k} }}}}".encode(), str(v).encode()) for k, v in values.items()]
+    for rel in _PLACEHOLDER_FILES:
+        path = root / rel
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            continue
+        filled = data
+        for token, value in replacements:
+            filled = filled.replace(token, value)
+        if filled != data:
+            path.write_bytes(filled)
+
 @app.command()
 def create(
     project_name: str = typer.Argument(..., help="The name of the project to create"),
@@ -123,11 +150,14 @@ def create(
 
     # Copy templates
     # shutil.copytree(TEMPLATE_DIR, target_dir)
-    shutil.copytree(
+    _parallel_copytree(
         TEMPLATE_DIR,
         target_dir,
+        # Patterns match entry names, not paths: "codegen" is the generator's
+        # own template dir (rendered by sync, never part of a project) and
+        # __pycache__ holds bytecode from importing the template backend.
         ignore=shutil.ignore_patterns(
-            "templates/codegen"
+            "codegen", "__pycache__"
         )
     )
 
@@ -136,21 +166,12 @@ def create(
     # For now, we just copied, let's assume simple copy is fine for most,
     # but we might want to replace {{ project_name }} in config.py
 
-    config_file = target_dir / "backend/app/core/config.py"
-    if config_file.exists():
-        content = config_file.read_text()
-        content = content.replace("{{ project_name }}", project_name)
-        content = content.replace("{{ access_token_expire_minutes }}", "11520")
-        config_file.write_text(content)
-
-    index_html = target_dir / "frontend/index.html"
-    if index_html.exists():
-        content = index_html.read_text()
-        content = content.replace("{{ project_name }}", project_name)
-        index_html.write_text(content)
+    _fill_placeholders(target_dir, {
+        "project_name": project_name,
+        "access_token_expire_minutes": 11520,
+    })
 
     # Generate site_config.json
-    import json
     site_config = {
         "project_name": project_name,
         "database_url": "sqlite:///./app.db",
@@ -173,7 +194,12 @@ def sync(
     Optionally install dependencies with --install.
     """
     # Ensure we are in a valid directory
-    get_cwd_safely()
+    base_dir = get_cwd_safely()
+
+    # Only sync imports from the user's project, so only sync puts it on
+    # sys.path; the other commands keep a shorter import search path.
+    if str(base_dir) not in sys.path:
+        sys.path.append(str(base_dir))
 
     console.print("[green]Syncing models...[/green]")
     from onesite.generator import generate_code
@@ -181,20 +207,37 @@ def sync(
 
     if install:
         console.print("[green]Installing dependencies...[/green]")
-        import subprocess
-        base_dir = get_cwd_safely()
         backend_dir = base_dir / "backend"
         frontend_dir = base_dir / "frontend"
 
-        # Install Backend Dependencies
-        if (backend_dir / "requirements.txt").exists():
-            console.print("[blue]Installing backend dependencies...[/blue]")
-            subprocess.run([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"], cwd=str(backend_dir))
-
-        # Install Frontend Dependencies
-        if (frontend_dir / "package.json").exists():
-             console.print("[blue]Installing frontend dependencies...[/blue]")
-             subprocess.run(["npm", "install"], cwd=str(frontend_dir))
+        # pip and npm are independent and mostly wait on the network, so run
+        # them side by side.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            futures = []
+
+            # Install Backend Dependencies
+            if (backend_dir / "requirements.txt").exists():
+                console.print("[blue]Installing backend dependencies...[/blue]")
+                futures.append(executor.submit(
+                    subprocess.run,
+                    [sys.executable, "-m", "pip", "install", "-r", "requirements.txt"],
+                    cwd=str(backend_dir),
+                ))
+
+            # Install Frontend Dependencies
+            if (frontend_dir / "package.json").exists():
+                console.print("[blue]Installing frontend dependencies...[/blue]")
+                futures.append(executor.submit(
+                    subprocess.run,
+                    ["npm", "install", "--no-audit", "--no-fund"],
+                    cwd=str(frontend_dir),
+                ))
+
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    console.print(f"[red]Error: {e}[/red]")
 
 @app.command()
 def run(
@@ -206,51 +249,112 @@ def run(
     """
     console.print(f"[green]Running {component}...[/green]")
 
-    import subprocess
-    import concurrent.futures
-
     base_dir = project_path.resolve()
     backend_dir = base_dir / "backend"
     frontend_dir = base_dir / "frontend"
 
-    def run_backend():
+    # With a single component there is nothing left for this process to do once
+    # the server starts, so exec into it and free the interpreter. This happens
+    # before any event loop exists. Windows has no real exec (os.execvp spawns
+    # and exits), so keep the child there.
+    replace_process = component in ["backend", "frontend"] and os.name != "nt"
+
+    # Each planner prints its status and returns (command, cwd, setup command
+    # or None), or None when the component cannot be started.
+    def plan_backend():
         if not backend_dir.exists():
              console.print(f"[red]Backend directory not found at {backend_dir}![/red]")
              console.print("[yellow]Tip: Make sure you are in the project directory or specify the project path.[/yellow]")
-             return
+             return None
         console.print("[blue]Starting Backend...[/blue]")
-        subprocess.run(["uvicorn", "app.main:app", "--reload"], cwd=str(backend_dir))
+        return ["uvicorn", "app.main:app", "--reload"], backend_dir, None
 
-    def run_frontend():
+    def plan_frontend():
         if not frontend_dir.exists():
              console.print(f"[red]Frontend directory not found at {frontend_dir}![/red]")
-             return
+             return None
 
         package_json = frontend_dir / "package.json"
         if package_json.exists():
             console.print("[blue]Starting Frontend (npm run dev)...[/blue]")
+            setup = None
             # Check if node_modules exists, if not maybe suggest install?
             if not (frontend_dir / "node_modules").exists():
                 console.print("[yellow]node_modules not found. Installing dependencies...[/yellow]")
-                subprocess.run(["npm", "install"], cwd=str(frontend_dir))
-
-            subprocess.run(["npm", "run", "dev"], cwd=str(frontend_dir))
+                setup = ["npm", "install"]
+            return ["npm", "run", "dev"], frontend_dir, setup
         else:
             console.print("[blue]Starting Frontend...[/blue]")
             console.print("[yellow]Frontend runner not fully implemented without package.json, skipping...[/yellow]")
+            return None
 
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-        futures = []
-        if component in ["backend", "all"]:
-            futures.append(executor.submit(run_backend))
-        if component in ["frontend", "all"]:
-            futures.append(executor.submit(run_frontend))
+    planners = {"backend": plan_backend, "frontend": plan_frontend}
 
-        for future in concurrent.futures.as_completed(futures):
-            try:
-                future.result()
-            except Exception as e:
-                console.print(f"[red]Error: {e}[/red]")
+    if replace_process:
+        plan = planners[component]()
+        if plan is None:
+            return
+        cmd, cwd, setup = plan
+        try:
+            if setup:
+                subprocess.run(setup, cwd=str(cwd))
+            os.chdir(cwd)
+            os.execvp(cmd[0], cmd)
+        except OSError as e:
+            console.print(f"[red]Error: {e}[/red]")
+        return
+
+    async def spawn_and_wait(cmd, cwd):
+        proc = await asyncio.create_subprocess_exec(*cmd, cwd=str(cwd))
+        try:
+            await proc.wait()
+        except asyncio.CancelledError:
+            # Ctrl-C cancels the gather below; don't leave the child orphaned.
+            proc.terminate()
+            raise
+
+    async def launch(plan):
+        if plan is None:
+            return
+        cmd, cwd, setup = plan
+        if setup:
+            await spawn_and_wait(setup, cwd)
+        await spawn_and_wait(cmd, cwd)
+
+    async def run_components():
+        # The servers are child processes, so a single event loop can wait on
+        # all of them; no thread per component is needed.
+        runners = [
+            launch(planner())
+            for name, planner in planners.items()
+            if component in [name, "all"]
+        ]
+
+        for result in await asyncio.gather(*runners, return_exceptions=True):
+            if isinstance(result, Exception):
+                console.print(f"[red]Error: {result}[/red]")
+
+    asyncio.run(run_components())
+
+def _existing_images(engine: str) -> set:
+    """Return every local image as "repository:tag", from one listing call."""
+    try:
+        result = subprocess.run(
+            [engine, "images", "--format", "{{.Repository}}:{{.Tag}}"],
+            capture_output=True,
+            text=True,
+            stdin=subprocess.DEVNULL,
+            check=False,
+        )
+    except OSError:
+        # Engine not installed; run_build will report it
+        return set()
+    images = set()
+    for ref in result.stdout.split():
+        images.add(ref)
+        # Podman lists locally built images as localhost/<name>:<tag>
+        images.add(ref.removeprefix("localhost/"))
+    return images
 
 @app.command()
 def build(
@@ -266,7 +370,6 @@ def build(
     - API_URL: Backend API URL (default: http://backend:80)
     - WS_URL: WebSocket URL (default: ws://backend:80)
     """
-    import subprocess
     from onesite.generator import generate_file
 
     base_dir = get_cwd_safely()
@@ -289,23 +392,20 @@ def build(
         except FileNotFoundError:
             console.print(f"[red]Engine '{engine}' not found. Please install it or check your path.[/red]")
 
+    existing_images = _existing_images(engine)
+
     if component in ["backend", "all"]:
         backend_dir = base_dir / "backend"
         if (backend_dir / "Dockerfile").exists():
             # Prompt for deleting existing images
             should_build = True
-            try:
-                existing_images = subprocess.getoutput(f"{engine} images -q {backend_image}")
-                if existing_images and "command not found" not in existing_images:
-                    if typer.confirm(f"Image {backend_image} already exists. Delete it?", default=True):
-                        console.print(f"[blue]Deleting {backend_image}...[/blue]")
-                        subprocess.run([engine, "rmi", "-f", backend_image], check=False)
-                    else:
-                        console.print(f"[yellow]Skipping build for {backend_image} as per user request.[/yellow]")
-                        should_build = False
-            except Exception as e:
-                # Ignore errors here (e.g. docker not installed), run_build will handle/report it
-                pass
+            if backend_image in existing_images:
+                if typer.confirm(f"Image {backend_image} already exists. Delete it?", default=True):
+                    console.print(f"[blue]Deleting {backend_image}...[/blue]")
+                    subprocess.run([engine, "rmi", "-f", backend_image], check=False)
+                else:
+                    console.print(f"[yellow]Skipping build for {backend_image} as per user request.[/yellow]")
+                    should_build = False
 
             if should_build:
                 run_build(backend_dir, backend_image)
@@ -317,17 +417,13 @@ def build(
         if (frontend_dir / "Dockerfile").exists():
             # Prompt for deleting existing images
             should_build = True
-            try:
-                existing_images = subprocess.getoutput(f"{engine} images -q {frontend_image}")
-                if existing_images and "command not found" not in existing_images:
-                    if typer.confirm(f"Image {frontend_image} already exists. Delete it?", default=True):
-                        console.print(f"[blue]Deleting {frontend_image}...[/blue]")
-                        subprocess.run([engine, "rmi", "-f", frontend_image], check=False)
-                    else:
-                        console.print(f"[yellow]Skipping build for {frontend_image} as per user request.[/yellow]")
-                        should_build = False
-            except Exception as e:
-                pass
+            if frontend_image in existing_images:
+                if typer.confirm(f"Image {frontend_image} already exists. Delete it?", default=True):
+                    console.print(f"[blue]Deleting {frontend_image}...[/blue]")
+                    subprocess.run([engine, "rmi", "-f", frontend_image], check=False)
+                else:
+                    console.print(f"[yellow]Skipping build for {frontend_image} as per user request.[/yellow]")
+                    should_build = False
 
             if should_build:
                 run_build(frontend_dir, frontend_image)
@@ -342,7 +438,6 @@ def build(
     site_config = {}
     site_config_file = base_dir / "site_config.json"
     if site_config_file.exists():
-        import json
         try:
             site_config = json.loads(site_config_file.read_text())
             db_url = site_config.get("database_url", "")
@@ -378,7 +473,6 @@ def compose(
         site compose down
         site compose logs -f
     """
-    import subprocess
 
     base_dir = get_cwd_safely()
     compose_file = base_dir / "docker-compose.yml"
@@ -409,5 +503,16 @@ def compose(
     except FileNotFoundError:
         console.print(f"[red]Command '{compose_cmd}' not found. Please install it.[/red]")
 
+@app.command("compile-templates", hidden=True)
+def precompile_templates():
+    """
+    Precompile the codegen templates into templates.zip (a packaging step).
+    sync loads templates from it while it is newer than every source template.
+    """
+    from onesite.codegen.render import COMPILED_TEMPLATES, compile_templates
+
+    compile_templates()
+    console.print(f"[green]Compiled templates to {COMPILED_TEMPLATES}[/green]")
+
 if __name__ == "__main__":
     app()
@@ -1,25 +1,71 @@
 from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi.concurrency import run_in_threadpool
+import os
 import shutil
-import uuid
+from secrets import token_hex
 from pathlib import Path
+from typing import BinaryIO
 from app.core.config import settings
 
 router = APIRouter()
 
+# Created once at import rather than on every request.
+UPLOAD_DIR = Path("uploads")
+UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+
+COPY_BUFSIZE = 1024 * 1024
+
+
+def _kernel_copy(src_fd: int, dst_fd: int, size: int) -> None:
+    # copy_file_range can share extents (reflink) instead of moving bytes when
+    # source and destination are on the same filesystem; sendfile still keeps
+    # the copy in-kernel everywhere else.
+    if hasattr(os, "copy_file_range"):
+        try:
+            offset = 0
+            while offset < size:
+                copied = os.copy_file_range(src_fd, dst_fd, size - offset, offset, offset)
+                if copied == 0:
+                    break
+                offset += copied
+            return
+        except OSError:
+            pass
+    offset = 0
+    while offset < size:
+        sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+        if sent == 0:
+            break
+        offset += sent
+
+
+def _save_upload(src: BinaryIO, dst: Path) -> None:
+    src.seek(0)
+    with dst.open("wb") as buffer:
+        # Uploads larger than the spool size are already in a real temp file;
+        # copy those in-kernel. In-memory spools have no fd, so calling fileno()
+        # on them would force a needless rollover to disk first.
+        if hasattr(os, "sendfile") and getattr(src, "_rolled", True):
+            try:
+                src_fd = src.fileno()
+                _kernel_copy(src_fd, buffer.fileno(), os.fstat(src_fd).st_size)
+                return
+            except OSError:
+                src.seek(0)
+                buffer.seek(0)
+                buffer.truncate()
+        shutil.copyfileobj(src, buffer, COPY_BUFSIZE)
+
 @router.post("/upload")
 async def upload_file(file: UploadFile = File(...)):
-    # Define upload directory
-    upload_dir = Path("uploads")
-    upload_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Generate unique filename
-    file_ext = Path(file.filename).suffix
-    unique_filename = f"{uuid.uuid4()}{file_ext}"
-    file_path = upload_dir / unique_filename
+    # Generate unique filename; keep only the extension of the client's name
+    file_ext = os.path.splitext(os.path.basename(file.filename or ""))[1]
+    unique_filename = f"{token_hex(16)}{file_ext}"
+    file_path = UPLOAD_DIR / unique_filename
     
     try:
-        with file_path.open("wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        # Blocking disk I/O; keep it off the event loop so other requests proceed.
+        await run_in_threadpool(_save_upload, file.file, file_path)
             
         # Construct URL
         # Served at /uploads
@@ -1,5 +1,6 @@
+from functools import cached_property
 from pydantic_settings import BaseSettings
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Tuple
 from pydantic import field_validator, AnyHttpUrl
 
 class Settings(BaseSettings):
@@ -11,6 +12,7 @@ class Settings(BaseSettings):
     FIRST_SUPERUSER: str = "admin@example.com"
     FIRST_SUPERUSER_PASSWORD: str = "admin"
     BACKEND_CORS_ORIGINS: List[AnyHttpUrl] = []
+    SQL_ECHO: bool = False
 
     @field_validator("BACKEND_CORS_ORIGINS", mode="before")
     @classmethod
@@ -21,8 +23,19 @@ class Settings(BaseSettings):
             return v
         raise ValueError(v)
 
+    @cached_property
+    def BACKEND_CORS_ORIGINS_STR(self) -> Tuple[str, ...]:
+        # Stringified once for CORSMiddleware rather than re-serializing each URL.
+        return tuple(str(origin) for origin in self.BACKEND_CORS_ORIGINS)
+
     class Config:
         env_file = ".env"
         extra = "ignore" # Ignore extra env vars
 
 settings = Settings()
+
+# What the generated API and frontend actually use. Explicit lists let
+# CORSMiddleware answer preflights from precomputed headers instead of echoing
+# the request's; extend these rather than switching back to "*".
+CORS_ALLOW_METHODS: List[str] = ["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"]
+CORS_ALLOW_HEADERS: List[str] = ["Authorization", "Content-Type"]
@@ -1,8 +1,6 @@
 import asyncio
 from sqlmodel import select
-from sqlmodel.ext.asyncio.session import AsyncSession
-from sqlalchemy.orm import sessionmaker
-from app.core.db import engine, init_db
+from app.core.db import AsyncSessionLocal, init_db
 from app.models.user import User, UserRole
 from app.core.config import settings
 from app.core.security import get_password_hash
@@ -11,25 +9,27 @@ from app.core.logger import get_logger
 logger = get_logger(__name__)
 
 async def init_data() -> None:
-    async_session = sessionmaker(
-        engine, class_=AsyncSession, expire_on_commit=False
-    )
-    async with async_session() as session:
-        result = await session.exec(
-            select(User).where(User.email == settings.FIRST_SUPERUSER)
+    async with AsyncSessionLocal() as session:
+        # Existence check only: fetch the PK (email is unique and indexed)
+        # instead of materialising a full User row.
+        user_id = await session.scalar(
+            select(User.id).where(User.email == settings.FIRST_SUPERUSER)
         )
-        user = result.first()
-        if not user:
+        if user_id is None:
+            # Password hashing is deliberately slow CPU work; keep it off the
+            # event loop so startup doesn't stall other coroutines.
+            hashed_password = await asyncio.to_thread(
+                get_password_hash, settings.FIRST_SUPERUSER_PASSWORD
+            )
             user = User(
                 email=settings.FIRST_SUPERUSER,
-                hashed_password=get_password_hash(settings.FIRST_SUPERUSER_PASSWORD),
+                hashed_password=hashed_password,
                 is_active=True,
                 role=UserRole.DEVELOPER,
                 full_name="Admin User"
             )
             session.add(user)
             await session.commit()
-            await session.refresh(user)
             logger.info("Superuser created")
         else:
             logger.info("Superuser already exists")
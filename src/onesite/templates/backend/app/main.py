@@ -1,4 +1,5 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from starlette.middleware.cors import CORSMiddleware
 from pathlib import Path
@@ -6,32 +7,34 @@ from pathlib import Path
 from app.api.api import api_router
 from contextlib import asynccontextmanager
 
-from app.core.config import settings
+from app.core.config import settings, CORS_ALLOW_METHODS, CORS_ALLOW_HEADERS
 from app.core.db import init_db
 from app.initial_data import init_data
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Initialize DB
-    init_db()
+    await init_db()
     # Initialize Data
-    init_data()
+    await init_data()
     yield
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    # orjson encodes response bodies straight to bytes in native code.
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
 # Set all CORS enabled origins
-if settings.BACKEND_CORS_ORIGINS:
+if settings.BACKEND_CORS_ORIGINS_STR:
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=[str(origin) for origin in settings.BACKEND_CORS_ORIGINS],
+        allow_origins=settings.BACKEND_CORS_ORIGINS_STR,
         allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        allow_methods=CORS_ALLOW_METHODS,
+        allow_headers=CORS_ALLOW_HEADERS,
     )
 
 # Mount static files
@@ -44,8 +47,4 @@ uploads_path = Path("uploads")
 uploads_path.mkdir(exist_ok=True)
 app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
 
-@app.on_event("startup")
-def on_startup():
-    init_db()
-
 app.include_router(api_router, prefix=settings.API_V1_STR)
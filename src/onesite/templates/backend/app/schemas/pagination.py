@@ -1,5 +1,5 @@
 from typing import TypeVar, Generic, List
-from pydantic import BaseModel
+from pydantic import BaseModel, computed_field
 
 T = TypeVar("T")
 
@@ -8,11 +8,16 @@ class PaginatedResponse(BaseModel, Generic[T]):
     total: int
     page: int
     size: int
-    total_pages: int
+
+    # Derived when the response is serialized instead of stored; still part of
+    # the response schema.
+    @computed_field
+    @property
+    def total_pages(self) -> int:
+        return -(-self.total // self.size) if self.size > 0 else 0
 
     @classmethod
     def create(cls, data: List[T], total: int, page: int, size: int) -> "PaginatedResponse[T]":
-        return cls(
-            items=data, total=total, page=page, size=size,
-            total_pages=(total + size - 1) // size if size > 0 else 0
-        )
+        # Inputs come straight from the service layer, so skip re-validation;
+        # FastAPI validates the response against response_model anyway.
+        return cls.model_construct(items=data, total=total, page=page, size=size)